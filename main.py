@@ -2,11 +2,22 @@
 
 import pygame
 import math
+import functools
+import numpy as np
 
 # --- CONSTANTS ---
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 900
+FPS = 60
+IDLE_FPS = 30 # Event polling rate while nothing needs redrawing
 HEX_SIZE = 40
+HEX_WIDTH = HEX_SIZE * math.sqrt(3)
+HEX_HEIGHT = HEX_SIZE * 2
+HEX_WIDTH_HALF = HEX_WIDTH / 2
+HEX_ROW_PITCH = HEX_SIZE * 1.5 # Vertical distance between rows, 3/4 of the hex height
+# Corner angles and offsets of a pointy-top hex with radius 1, starting at -30 degrees
+_HEX_ANGLES_RAD = [math.radians(60 * i - 30) for i in range(6)]
+HEX_CORNERS_UNIT = [(math.cos(angle), math.sin(angle)) for angle in _HEX_ANGLES_RAD]
 
 # --- COLORS ---
 DEEP_WATER_BLUE = (25, 25, 112)
@@ -30,7 +41,7 @@ LAND = 3
 OUT_OF_BOUNDS = 0
 
 # --- MAP LAYOUT ---
-game_map = [
+GAME_MAP = np.array([
     [0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0],
     [0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0],
     [1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
@@ -44,7 +55,7 @@ game_map = [
     [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
     [0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0],
     [0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0],
-]
+], dtype=np.uint8)
 
 terrain_colors = {
     DEEP_WATER: DEEP_WATER_BLUE,
@@ -53,6 +64,57 @@ terrain_colors = {
     OUT_OF_BOUNDS: OUT_OF_BOUNDS_WHITE
 }
 
+# --- HEX DIRECTIONS ---
+# Cube coordinate deltas (dq, dr, ds), where q+r+s=0, indexed by our orientation:
+# 0:E, 1:SE, 2:SW, 3:W, 4:NW, 5:NE
+ORIENT_DELTAS = [
+    (+1, 0, -1), # E
+    (0, +1, -1), # SE
+    (-1, +1, 0), # SW
+    (-1, 0, +1), # W
+    (0, -1, +1), # NW
+    (+1, -1, 0), # NE
+]
+
+def step(row, col, orientation, map_data):
+    """Returns the hex (row, col) one move forward, or (-1, -1) if the move is blocked.
+
+    Moves are blocked by the map edge, land and out-of-bounds hexes.
+    """
+    dq, dr, ds = ORIENT_DELTAS[orientation]
+
+    # The cube r coordinate is the row, so a move off the top or bottom edge
+    # is blocked before converting the column
+    new_row = row + dr
+    if not 0 <= new_row < map_data.shape[0]:
+        return -1, -1
+
+    # Convert offset to cube ("odd-r" layout), apply the step, and convert back to offset
+    q = col - (row - (row & 1)) // 2
+    new_col = q + dq + (new_row - (new_row & 1)) // 2
+    if not 0 <= new_col < map_data.shape[1]:
+        return -1, -1
+
+    # Only allow movement into water hexes (DEEP_WATER or SHALLOW_WATER)
+    terrain = map_data[new_row, new_col]
+    if terrain == DEEP_WATER or terrain == SHALLOW_WATER:
+        return new_row, new_col
+    return -1, -1
+
+def build_neighbor_table(map_data):
+    """Builds the step() destination for every hex and orientation.
+
+    Blocked moves are stored as (-1, -1).
+    """
+    map_height, map_width = map_data.shape
+    neighbors = np.full((map_height, map_width, 6, 2), -1, dtype=np.int8)
+    for (row, col), _ in np.ndenumerate(map_data):
+        for orientation in range(6):
+            neighbors[row, col, orientation] = step(row, col, orientation, map_data)
+    return neighbors
+
+NEIGHBORS = build_neighbor_table(GAME_MAP)
+
 # --- GAME STATE (placeholders) ---
 game_state = {
     "uboat_pos": (7, 7), # Initial position (row, col)
@@ -72,10 +134,9 @@ game_state = {
 }
 
 # --- SPRITE CLASSES ---
-class Uboat(pygame.sprite.Sprite):
+class Uboat:
     """Represents the player's U-Boat."""
     def __init__(self, initial_pos, initial_orientation, hex_size):
-        super().__init__()
         self.row, self.col = initial_pos
         self.orientation = initial_orientation # 0-5, 0 is right, increasing clockwise
         self.hex_size = hex_size
@@ -92,12 +153,18 @@ class Uboat(pygame.sprite.Sprite):
             self.original_image = pygame.transform.scale(self.original_image, (new_width, new_height))
         except pygame.error as e:
             print(f"Unable to load U-Boat image: {e}")
-            # Create a fallback red rectangle if image fails to load
-            self.original_image = pygame.Surface((self.hex_size, self.hex_size // 2))
+            # Create a fallback red rectangle if image fails to load. It needs
+            # per-pixel alpha so the padding added by rotation stays transparent.
+            self.original_image = pygame.Surface((self.hex_size, self.hex_size // 2)).convert_alpha()
             self.original_image.fill(TEXT_RED)
 
-        self.image = self.original_image
-        self.rect = self.image.get_rect()
+        # Pre-render the six orientations once; only these angles are ever used
+        # Pygame rotates counter-clockwise. Angle 0 is right.
+        self.rotated_images = [pygame.transform.rotate(self.original_image, -60 * i) for i in range(6)]
+        self.rotated_rects = [image.get_rect() for image in self.rotated_images]
+
+        self.image = self.rotated_images[self.orientation]
+        self.rect = self.rotated_rects[self.orientation]
         self.update_position_and_orientation()
 
     def turn(self, direction):
@@ -107,100 +174,113 @@ class Uboat(pygame.sprite.Sprite):
 
     def move_forward(self):
         """Move the U-Boat one hex in its current direction."""
-        # Cube directions: (q, r, s) where q+r+s=0
-        cube_directions = [
-            (+1, -1, 0), # NE
-            (+1, 0, -1), # E
-            (0, +1, -1), # SE
-            (-1, +1, 0), # SW
-            (-1, 0, +1), # W
-            (0, -1, +1), # NW
-        ]
-        # Our orientation: 0:E, 1:SE, 2:SW, 3:W, 4:NW, 5:NE
-        orientation_to_cube_map = [1, 2, 3, 4, 5, 0]
-
-        # Convert offset to cube
-        q = self.col - (self.row - (self.row & 1)) // 2
-        r = self.row
-        s = -q - r
-
-        # Get change from our orientation
-        dq, dr, ds = cube_directions[orientation_to_cube_map[self.orientation]]
-
-        # Calculate new cube coordinates
-        new_q, new_r, new_s = q + dq, r + dr, s + ds
-
-        # Convert back to offset
-        new_row = new_r
-        new_col = new_q + (new_r - (new_r & 1)) // 2
-        
-        # Check if the new position is valid (within bounds and not land)
-        if 0 <= new_row < len(game_map) and 0 <= new_col < len(game_map[0]):
-            terrain = game_map[new_row][new_col]
-            # Only allow movement into water hexes (DEEP_WATER or SHALLOW_WATER)
-            if terrain == DEEP_WATER or terrain == SHALLOW_WATER:
-                self.row = new_row
-                self.col = new_col
-                self.update_position_and_orientation()
-            # else: move blocked by land or out-of-bounds
-        # else: move blocked by map edge
+        new_row, new_col = NEIGHBORS[self.row, self.col, self.orientation].tolist()
+        if new_row >= 0:
+            self.row = new_row
+            self.col = new_col
+            self.update_position_and_orientation()
+        # else: move blocked by the map edge, land or out-of-bounds
 
     def update_position_and_orientation(self):
-        """Recalculates the screen position and rotates the image."""
-        # Pygame rotates counter-clockwise. Angle 0 is right.
-        angle = -60 * self.orientation
-        self.image = pygame.transform.rotate(self.original_image, angle)
+        """Recalculates the screen position and selects the rotated image."""
+        self.image = self.rotated_images[self.orientation]
         
         # Calculate screen position based on hex grid coordinates
-        hex_width = self.hex_size * math.sqrt(3)
-        hex_height = self.hex_size * 2
-        x_offset = hex_width / 2 if self.row % 2 != 0 else 0
+        x_offset = HEX_WIDTH_HALF if self.row % 2 != 0 else 0
         
-        center_x = self.col * hex_width + x_offset + hex_width / 2
-        center_y = self.row * hex_height * 0.75 + hex_height / 2
+        center_x = self.col * HEX_WIDTH + x_offset + HEX_WIDTH_HALF
+        center_y = self.row * HEX_ROW_PITCH + HEX_HEIGHT / 2
         
-        self.rect = self.image.get_rect(center=(center_x, center_y))
+        self.rect = self.rotated_rects[self.orientation]
+        self.rect.center = (center_x, center_y)
 
 # --- DRAWING FUNCTIONS ---
 
-def draw_hex(surface, x, y, size, color, border_color, width=1):
-    """Draws a filled hexagon with a border."""
-    points = []
-    for i in range(6):
-        angle_deg = 60 * i - 30
-        angle_rad = math.pi / 180 * angle_deg
-        points.append((x + size * math.cos(angle_rad),
-                       y + size * math.sin(angle_rad)))
+def draw_hex(surface, x, y, size, color, border_color=None, width=1):
+    """Draws a filled hexagon, with a border if border_color is given."""
+    points = [(x + size * cx, y + size * cy) for cx, cy in HEX_CORNERS_UNIT]
     pygame.draw.polygon(surface, color, points, 0)
-    pygame.draw.polygon(surface, border_color, points, width)
-
-def create_hex_grid_surface(map_data, hex_size):
-    """Creates a surface with the rendered hex grid based on map data."""
-    hex_width = hex_size * math.sqrt(3)
-    hex_height = hex_size * 2
-    map_height = len(map_data)
-    map_width = len(map_data[0]) if map_height > 0 else 0
-    total_width = map_width * hex_width + hex_width / 2
-    total_height = (map_height * hex_height * 0.75) + (hex_height * 0.25)
-    grid_surface = pygame.Surface((total_width, total_height))
+    if border_color is not None:
+        pygame.draw.polygon(surface, border_color, points, width)
+
+def hex_row_border_points(xs, y, size):
+    """Returns a single polyline that traces every edge of a row of hexes.
+
+    The path runs along the top edges from left to right, then back along the
+    bottom edges, going up and down each shared vertical edge on the way.
+    """
+    corners = [[(x + size * cx, y + size * cy) for cx, cy in HEX_CORNERS_UNIT] for x in xs]
+    # Corner indices: 0 upper right, 1 lower right, 2 bottom, 3 lower left, 4 upper left, 5 top
+    points = [corners[0][4]]
+    for hex_corners in corners:
+        points += [hex_corners[5], hex_corners[0]]
+    points.append(corners[-1][1])
+    for i, hex_corners in enumerate(reversed(corners)):
+        if i:
+            points += [hex_corners[0], hex_corners[1]]
+        points += [hex_corners[2], hex_corners[3]]
+    points.append(corners[0][4])
+    return points
+
+def create_hex_grid_surface(map_data):
+    """Creates a surface with the rendered hex grid based on map data.
+
+    The surface is opaque (no per-pixel alpha or colorkey) and converted to the
+    display's pixel format so it blits with a straight copy. The display must
+    already be set up.
+    """
+    map_height, map_width = map_data.shape
+    total_width = map_width * HEX_WIDTH + HEX_WIDTH_HALF
+    total_height = (map_height * HEX_ROW_PITCH) + (HEX_HEIGHT * 0.25)
+    grid_surface = pygame.Surface((total_width, total_height)).convert()
     grid_surface.fill(OUT_OF_BOUNDS_WHITE)
 
-    for row, row_data in enumerate(map_data):
-        for col, terrain in enumerate(row_data):
-            x_offset = hex_width / 2 if row % 2 != 0 else 0
-            x = col * hex_width + x_offset + hex_width / 2
-            y = row * hex_height * 0.75 + hex_height / 2
-            color = terrain_colors.get(terrain, OUT_OF_BOUNDS_WHITE)
-            draw_hex(grid_surface, x, y, hex_size, color, BORDER_BLACK)
+    # Hex centers for the whole grid; odd rows are shifted right by half a hex
+    cols = np.arange(map_width)
+    rows = np.arange(map_height)
+    x_offsets = np.where(rows % 2, HEX_WIDTH_HALF, 0.0)
+    xs = cols[None, :] * HEX_WIDTH + x_offsets[:, None] + HEX_WIDTH_HALF
+    ys = rows * HEX_ROW_PITCH + HEX_HEIGHT / 2
+    # Plain floats keep the per-corner arithmetic in draw_hex off numpy scalars
+    xs, ys = xs.tolist(), ys.tolist()
+
+    for (row, col), terrain in np.ndenumerate(map_data):
+        color = terrain_colors.get(terrain, OUT_OF_BOUNDS_WHITE)
+        draw_hex(grid_surface, xs[row][col], ys[row], HEX_SIZE, color)
+
+    # Borders go on after all fills, as one polyline per row rather than an outline per hex
+    for row in range(map_height):
+        border_points = hex_row_border_points(xs[row], ys[row], HEX_SIZE)
+        pygame.draw.lines(grid_surface, BORDER_BLACK, False, border_points)
             
     return grid_surface
 
+@functools.lru_cache(maxsize=256)
+def render_text(font, text, color):
+    """Renders anti-aliased text, reusing the surface for repeated labels."""
+    return font.render(text, True, color)
+
+# Shared rect for the filled centers of UI boxes, updated in place to avoid allocations
+_SCRATCH_RECT = pygame.Rect(0, 0, 0, 0)
+
+def inner_rect(rect):
+    """Returns the scratch rect set to rect shrunk by 2 pixels on each side."""
+    _SCRATCH_RECT.update(rect.x + 2, rect.y + 2, rect.width - 4, rect.height - 4)
+    return _SCRATCH_RECT
+
+# Rendered panel titles and their screen positions, keyed on (font, title, centerx, y)
+_TITLE_CACHE = {}
+
 def draw_ui_box(surface, rect, title, font_title):
     """Draws a titled box."""
     pygame.draw.rect(surface, PANEL_GRAY, rect, 2)
-    title_surf = font_title.render(title, True, TEXT_BLACK)
-    title_rect = title_surf.get_rect(centerx=rect.centerx, y=rect.y - 25)
-    surface.blit(title_surf, title_rect)
+    key = (font_title, title, rect.centerx, rect.y)
+    cached = _TITLE_CACHE.get(key)
+    if cached is None:
+        title_surf = render_text(font_title, title, TEXT_BLACK)
+        title_rect = title_surf.get_rect(centerx=rect.centerx, y=rect.y - 25)
+        cached = _TITLE_CACHE[key] = (title_surf, title_rect)
+    surface.blit(*cached)
 
 def draw_track(surface, rect, labels, current_index, font):
     """Draws a horizontal track with an indicator."""
@@ -209,12 +289,20 @@ def draw_track(surface, rect, labels, current_index, font):
         box_rect = pygame.Rect(rect.x + i * box_width, rect.y, box_width, rect.height)
         pygame.draw.rect(surface, BOX_GRAY, box_rect, 1)
         if i == current_index:
-            pygame.draw.rect(surface, TEXT_RED, box_rect.inflate(-4, -4))
+            pygame.draw.rect(surface, TEXT_RED, inner_rect(box_rect))
         
-        label_surf = font.render(label, True, TEXT_BLACK)
+        label_surf = render_text(font, label, TEXT_BLACK)
         label_rect = label_surf.get_rect(center=box_rect.center)
         surface.blit(label_surf, label_rect)
 
+def layout_boxes(rect, count, vertical=False):
+    """Splits a rect into equal boxes side by side, or stacked if vertical."""
+    if vertical:
+        box_height = rect.height / count
+        return [pygame.Rect(rect.x, rect.y + i * box_height, rect.width, box_height) for i in range(count)]
+    box_width = rect.width / count
+    return [pygame.Rect(rect.x + i * box_width, rect.y, box_width, rect.height) for i in range(count)]
+
 def draw_detection_level(surface, rect, game_state, fonts):
     """UI for Detection Level."""
     draw_ui_box(surface, rect, "DETECTION LEVEL", fonts["title"])
@@ -227,52 +315,46 @@ def draw_hull_damage(surface, rect, game_state, fonts):
     labels = ["OK", "DeepX", "MedX", "PeriX", "Dead"]
     draw_track(surface, rect, labels, game_state["hull_damage"], fonts["text"])
 
-def draw_torpedo_tubes(surface, rect, game_state, fonts):
+def draw_torpedo_tubes(surface, rect, box_rects, game_state, fonts):
     """UI for Torpedo Tubes."""
     draw_ui_box(surface, rect, "TORPEDO TUBES", fonts["title"])
     tubes = game_state["torpedo_tubes"]
-    box_width = rect.width / len(tubes)
-    for i, (tube_num, status) in enumerate(tubes.items()):
-        box_rect = pygame.Rect(rect.x + i * box_width, rect.y, box_width, rect.height)
+    for box_rect, (tube_num, status) in zip(box_rects, tubes.items()):
         pygame.draw.rect(surface, BOX_GRAY, box_rect, 1)
         
         color = TEXT_GREEN if status == "loaded" else (TEXT_YELLOW if status == "empty" else TEXT_RED)
-        pygame.draw.rect(surface, color, box_rect.inflate(-4, -4))
+        pygame.draw.rect(surface, color, inner_rect(box_rect))
 
-        num_surf = fonts["text_bold"].render(tube_num, True, TEXT_BLACK)
+        num_surf = render_text(fonts["text_bold"], tube_num, TEXT_BLACK)
         num_rect = num_surf.get_rect(centerx=box_rect.centerx, y=box_rect.y + 5)
         surface.blit(num_surf, num_rect)
 
-def draw_crew_status(surface, rect, game_state, fonts):
+def draw_crew_status(surface, rect, box_rects, game_state, fonts):
     """UI for Crew Status."""
     draw_ui_box(surface, rect, "CREW STATUS", fonts["title"])
     crew = game_state["crew_status"]
-    box_width = rect.width / len(crew)
-    for i, (name, status) in enumerate(crew.items()):
-        box_rect = pygame.Rect(rect.x + i * box_width, rect.y, box_width, rect.height)
+    for box_rect, (name, status) in zip(box_rects, crew.items()):
         pygame.draw.rect(surface, BOX_GRAY, box_rect, 1)
         
         if status != "OK":
             pygame.draw.line(surface, TEXT_RED, (box_rect.left, box_rect.top), (box_rect.right, box_rect.bottom), 3)
             pygame.draw.line(surface, TEXT_RED, (box_rect.right, box_rect.top), (box_rect.left, box_rect.bottom), 3)
 
-        name_surf = fonts["text_small"].render(name, True, TEXT_BLACK)
+        name_surf = render_text(fonts["text_small"], name, TEXT_BLACK)
         name_rect = name_surf.get_rect(center=box_rect.center)
         surface.blit(name_surf, name_rect)
 
-def draw_system_damage(surface, rect, game_state, fonts):
+def draw_system_damage(surface, rect, box_rects, game_state, fonts):
     """UI for System Damage."""
     draw_ui_box(surface, rect, "SYSTEM DAMAGE", fonts["title"])
     systems = game_state["system_damage"]
-    box_height = rect.height / len(systems)
-    for i, (name, status) in enumerate(systems.items()):
-        box_rect = pygame.Rect(rect.x, rect.y + i * box_height, rect.width, box_height)
+    for box_rect, (name, status) in zip(box_rects, systems.items()):
         pygame.draw.rect(surface, BOX_GRAY, box_rect, 1)
 
         if status != "OK":
-             pygame.draw.rect(surface, TEXT_RED, box_rect.inflate(-4, -4))
+             pygame.draw.rect(surface, TEXT_RED, inner_rect(box_rect))
 
-        name_surf = fonts["text"].render(name, True, TEXT_BLACK)
+        name_surf = render_text(fonts["text"], name, TEXT_BLACK)
         name_rect = name_surf.get_rect(center=box_rect.center)
         surface.blit(name_surf, name_rect)
 
@@ -294,12 +376,11 @@ def main():
     pygame.display.set_caption("Lone U-Boat")
 
     # Create the map surface and center it
-    map_surface = create_hex_grid_surface(game_map, HEX_SIZE)
+    map_surface = create_hex_grid_surface(GAME_MAP)
     map_rect = map_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
     # Create the U-Boat
     uboat = Uboat(game_state["uboat_pos"], game_state["uboat_orientation"], HEX_SIZE)
-    uboat_sprite_group = pygame.sprite.GroupSingle(uboat)
 
     # Define UI element rectangles
     detection_rect = pygame.Rect(50, 50, 300, 40)
@@ -308,38 +389,71 @@ def main():
     crew_rect = pygame.Rect(50, SCREEN_HEIGHT - 100, 700, 50)
     damage_rect = pygame.Rect(SCREEN_WIDTH - 200, SCREEN_HEIGHT - 200, 150, 150)
 
+    # The UI layout is fixed, so the boxes inside each panel are laid out once
+    torpedo_box_rects = layout_boxes(torpedo_rect, len(game_state["torpedo_tubes"]))
+    crew_box_rects = layout_boxes(crew_rect, len(game_state["crew_status"]))
+    damage_box_rects = layout_boxes(damage_rect, len(game_state["system_damage"]), vertical=True)
+
+    # Screen regions pushed to the display on a redraw; titles sit above each box
+    ui_rects = [rect.union(rect.move(0, -25))
+                for rect in (detection_rect, hull_rect, torpedo_rect, crew_rect, damage_rect)]
+
+    # The map with the U-Boat drawn on it, so the screen takes a single blit
+    scene_surface = map_surface.copy()
+    uboat_last_rect = uboat.rect.copy()
+
     # Game loop
+    clock = pygame.time.Clock()
     running = True
+    dirty = True
+    full_redraw = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            if event.type == pygame.VIDEOEXPOSE:
+                full_redraw = True
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_d: # Turn Clockwise
                     uboat.turn(1)
+                    dirty = True
                 if event.key == pygame.K_a: # Turn Counter-Clockwise
                     uboat.turn(-1)
+                    dirty = True
                 if event.key == pygame.K_w: # Move Forward
                     uboat.move_forward()
+                    dirty = True
+
+        # Nothing changed since the last frame, so there is nothing to redraw
+        if not (dirty or full_redraw):
+            clock.tick(IDLE_FPS)
+            continue
 
         # --- Drawing ---
         screen.fill(BACKGROUND_GRAY)
         
-        # Draw map
-        screen.blit(map_surface, map_rect)
+        # Draw U-Boat on the scene, restoring the map where it was last drawn
+        scene_surface.blit(map_surface, uboat_last_rect, uboat_last_rect)
+        scene_surface.blit(uboat.image, uboat.rect)
+        uboat_last_rect = uboat.rect.copy()
 
-        # Draw U-Boat on the map, adjusting for the map's position
-        uboat_draw_pos = uboat.rect.move(map_rect.topleft)
-        screen.blit(uboat.image, uboat_draw_pos)
+        # Draw map
+        screen.blit(scene_surface, map_rect)
         
         # Draw UI elements
         draw_detection_level(screen, detection_rect, game_state, fonts)
         draw_hull_damage(screen, hull_rect, game_state, fonts)
-        draw_torpedo_tubes(screen, torpedo_rect, game_state, fonts)
-        draw_crew_status(screen, crew_rect, game_state, fonts)
-        draw_system_damage(screen, damage_rect, game_state, fonts)
-
-        pygame.display.flip()
+        draw_torpedo_tubes(screen, torpedo_rect, torpedo_box_rects, game_state, fonts)
+        draw_crew_status(screen, crew_rect, crew_box_rects, game_state, fonts)
+        draw_system_damage(screen, damage_rect, damage_box_rects, game_state, fonts)
+
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update([map_rect, *ui_rects])
+        dirty = False
+        full_redraw = False
+        clock.tick(FPS)
 
     pygame.quit()
 